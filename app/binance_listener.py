@@ -1,15 +1,26 @@
 import asyncio
-import json
 import logging
 import random
-from typing import List
+from typing import Callable, List, Union
 
+import msgspec
 import websockets
 
 from .config import Settings
-from .schemas import TickerUpdate
+from .schemas import CombinedTickerMsg, TickerMsg, TickerUpdate
 from .state import Broker
 
+_single_decoder = msgspec.json.Decoder(TickerMsg)
+_combined_decoder = msgspec.json.Decoder(CombinedTickerMsg)
+
+
+def _decode_combined(raw: Union[str, bytes]) -> TickerMsg:
+    """Combined-stream frames wrap the ticker as {"stream": ..., "data": {...}}."""
+    return _combined_decoder.decode(raw).data
+
+
+_RECV_TIMEOUT = 90.0  # no data for this long? treat the connection as dead.
+
 
 class BinanceListener:
     """
@@ -23,6 +34,18 @@ class BinanceListener:
         self.broker = broker
         self.stop_event = stop_event
 
+        # Resolved once; reconnects reuse them instead of re-reading settings.
+        self._url = self._build_url(settings.symbols)
+        self._combined = len(settings.symbols) > 1
+        self._backoff_min = settings.reconnect_min_delay
+        self._backoff_max = settings.reconnect_max_delay
+
+        # Backoff bases per consecutive failure: min, 2*min, 4*min, ... capped at max.
+        schedule = [self._backoff_min]
+        while 0 < schedule[-1] < self._backoff_max:
+            schedule.append(min(self._backoff_max, schedule[-1] * 2))
+        self._backoff_schedule = tuple(schedule)
+
     def _build_url(self, symbols: List[str]) -> str:
         syms = [s.lower() for s in symbols]
         base = self.settings.binance_base_url.rstrip("/")
@@ -32,49 +55,30 @@ class BinanceListener:
         return f"{base}/stream?streams={streams}"
 
     async def run(self) -> None:
-        backoff = self.settings.reconnect_min_delay
-        url = self._build_url(self.settings.symbols)
+        failures = 0
+        last_step = len(self._backoff_schedule) - 1
+        url = self._url
+        # Frame shape is fixed by the URL, so pick the decoder once rather than per frame.
+        decode = _decode_combined if self._combined else _single_decoder.decode
 
         while not self.stop_event.is_set():
             try:
+                # max_queue=None: frames are not buffered inside websockets; the
+                # per-client broker queues (client_queue_size) are the only
+                # backpressure point. Ticker frames are small JSON, so
+                # permessage-deflate would cost more CPU than it saves.
                 async with websockets.connect(
                     url,
                     ping_interval=None,
                     close_timeout=10,
                     max_size=2**20,     # 1 MiB
                     max_queue=None,
+                    compression=None,
                     open_timeout=20,
                 ) as ws:
                     logging.info("Connected to Binance WS: %s", url)
-                    backoff = self.settings.reconnect_min_delay
-
-                    while not self.stop_event.is_set():
-                        try:
-                            raw = await asyncio.wait_for(ws.recv(), timeout=90.0)  # no data for 90s? treat as dead.
-                        except asyncio.TimeoutError:
-                            raise TimeoutError("no data from Binance within 90s; reconnecting")
-                    
-                    async for raw in ws:
-                        if self.stop_event.is_set():
-                            break
-
-                        try:
-                            payload = json.loads(raw)
-                        except json.JSONDecodeError:
-                            logging.warning("Invalid JSON from Binance (truncated): %r", raw[:200])
-                            continue
-
-                        data = payload.get("data", payload)
-                        if not isinstance(data, dict):
-                            continue
-
-                        try:
-                            update = TickerUpdate.from_binance(data)
-                        except Exception as e:
-                            logging.debug("Skipping malformed ticker: %s (keys=%s)", e, list(data.keys()))
-                            continue
-
-                        await self.broker.publish(update)
+                    failures = 0
+                    await self._receive(ws, decode)
 
             except asyncio.CancelledError:
                 raise
@@ -82,13 +86,34 @@ class BinanceListener:
                 logging.exception("Binance WS error: %s", e)
 
                 # Jittered exponential backoff, bounded
-                jitter = random.uniform(0, backoff)
-                delay = min(self.settings.reconnect_max_delay, backoff + jitter)
+                backoff = self._backoff_schedule[failures]
+                failures = min(failures + 1, last_step)
+                delay = min(self._backoff_max, backoff + random.uniform(0, backoff))
                 logging.warning("Reconnecting to Binance in %.2fs ...", delay)
                 try:
-                    await asyncio.wait_for(self.stop_event.wait(), timeout=delay)
-                except asyncio.TimeoutError:
+                    async with asyncio.timeout(delay):
+                        await self.stop_event.wait()
+                except TimeoutError:
                     pass
-                backoff = min(self.settings.reconnect_max_delay, backoff * 2)
 
-        logging.info("BinanceListener stopped.")
\ No newline at end of file
+        logging.info("BinanceListener stopped.")
+
+    async def _receive(self, ws, decode: Callable[[Union[str, bytes]], TickerMsg]) -> None:
+        """Receive loop: decode each frame to a TickerMsg and publish it until stopped."""
+        publish = self.broker.publish
+        while not self.stop_event.is_set():
+            try:
+                raw = await asyncio.wait_for(ws.recv(), timeout=_RECV_TIMEOUT)
+            except asyncio.TimeoutError:
+                raise TimeoutError(f"no data from Binance within {_RECV_TIMEOUT:.0f}s; reconnecting")
+
+            try:
+                msg = decode(raw)
+            except msgspec.ValidationError as e:
+                logging.debug("Skipping malformed ticker: %s", e)
+                continue
+            except msgspec.DecodeError:
+                logging.warning("Invalid JSON from Binance (truncated): %r", raw[:200])
+                continue
+
+            await publish(TickerUpdate.from_binance(msg))
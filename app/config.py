@@ -1,4 +1,5 @@
 import json
+from functools import lru_cache
 from typing import List, Annotated
 from pydantic import BeforeValidator
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -43,6 +44,7 @@ class Settings(BaseSettings):
     ping_timeout: float = 20.0
 
     client_queue_size: int = 100
+    ws_max_batch: int = 50  # max queued messages merged into one WS frame
     host: str = "0.0.0.0"
     port: int = 8000
     log_level: str = "INFO"
@@ -53,4 +55,10 @@ class Settings(BaseSettings):
 
     cors_allow_origins: CsvList = ["*"]
 
-    model_config = SettingsConfigDict(env_prefix="APP_", case_sensitive=False)
\ No newline at end of file
+    model_config = SettingsConfigDict(env_prefix="APP_", case_sensitive=False)
+
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Process-wide Settings, parsed from the environment once."""
+    return Settings()
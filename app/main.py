@@ -2,44 +2,63 @@ import asyncio
 import contextlib
 import logging
 import time
-from collections import defaultdict, deque
+from collections import defaultdict
 from contextlib import asynccontextmanager
-from typing import AsyncIterator, Deque, Dict
+from typing import AsyncIterator, Dict
 
 from fastapi import FastAPI, WebSocket, WebSocketDisconnect, HTTPException, Request, Query
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import ORJSONResponse
+from fastapi.responses import ORJSONResponse, Response
 
 from .binance_listener import BinanceListener
-from .config import Settings
+from .config import get_settings
 from .state import Broker
 
+_KEEPALIVE_FRAME: bytes = b'{"type":"keepalive"}'
+
+
+def _wrap_batch(frames: list[bytes]) -> bytes:
+    """Merge already-encoded JSON messages into one {"type":"batch","data":[...]} frame."""
+    return b'{"type":"batch","data":[' + b",".join(frames) + b"]}"
+
 class InMemoryRateLimiter:
     """
-    Simple sliding-window limiter per key (IP).
+    Fixed-window counter per key (IP): O(1) per hit, one (window, count) pair per key.
     Suitable for a single-process container. For distributed limits, use Redis + fastapi-limiter.
     """
+    _SWEEP_EVERY = 1024  # hits between evictions of keys from past windows
+
     def __init__(self, capacity: int, period_seconds: float) -> None:
         self.capacity = int(max(1, capacity))
         self.period = float(max(1.0, period_seconds))
-        self._buckets: Dict[str, Deque[float]] = defaultdict(deque)
-        self._lock = asyncio.Lock()
+        self._buckets: Dict[str, tuple[int, int]] = {}
+        self._hits = 0
 
     async def hit(self, key: str) -> bool:
-        now = time.monotonic()
-        cutoff = now - self.period
-        async with self._lock:
-            q = self._buckets[key]
-            while q and q[0] < cutoff:
-                q.popleft()
-            if len(q) >= self.capacity:
-                return False
-            q.append(now)
-            return True
+        # No awaits below, so the read-modify-write is atomic on the event loop.
+        window = int(time.monotonic() // self.period)
+
+        self._hits += 1
+        if self._hits >= self._SWEEP_EVERY:
+            self._hits = 0
+            self._sweep(window)
+
+        bucket = self._buckets.get(key)
+        count = bucket[1] if bucket is not None and bucket[0] == window else 0
+        if count >= self.capacity:
+            return False
+        self._buckets[key] = (window, count + 1)
+        return True
+
+    def _sweep(self, window: int) -> None:
+        stale = [k for k, (w, _) in self._buckets.items() if w != window]
+        for k in stale:
+            del self._buckets[k]
 
 def create_app() -> FastAPI:
-    settings = Settings()
+    settings = get_settings()
     broker = Broker(client_queue_size=settings.client_queue_size)
+    max_batch = max(1, settings.ws_max_batch)
     stop_event = asyncio.Event()
     limiter = InMemoryRateLimiter(
         capacity=settings.price_rate_limit_per_minute,
@@ -99,8 +118,7 @@ def create_app() -> FastAPI:
 
     @app.get("/latest")
     async def latest():
-        data = await broker.latest()
-        return {"data": data}
+        return Response(content=await broker.latest_bytes(), media_type="application/json")
 
     @app.get("/price")
     async def get_price(
@@ -113,16 +131,15 @@ def create_app() -> FastAPI:
         if not allowed:
             raise HTTPException(status_code=429, detail="Too Many Requests")
 
-        snapshot = await broker.latest()
         if symbol:
             sym = symbol.upper().strip()
-            for item in snapshot:
-                if item["symbol"] == sym:
-                    return {"symbol": sym, "last_price": item["last_price"], "change_percent": item["change_percent"], "timestamp": item["timestamp"]}
-            raise HTTPException(status_code=404, detail=f"Symbol {sym} not found")
+            cached = await broker.latest_for(sym)
+            if cached is None:
+                raise HTTPException(status_code=404, detail=f"Symbol {sym} not found")
+            return Response(content=cached, media_type="application/json")
         # No symbol: return all
         # (Clients can filter what they need)
-        return {"data": snapshot}
+        return Response(content=await broker.latest_bytes(), media_type="application/json")
     
     @app.websocket("/ws")
     async def ws(websocket: WebSocket):
@@ -131,11 +148,22 @@ def create_app() -> FastAPI:
 
         try:
             while True:
-                try:
-                    msg = await asyncio.wait_for(queue.get(), timeout=30.0)
-                    await websocket.send_text(msg)
-                except asyncio.TimeoutError:
-                    await websocket.send_text('{"type":"keepalive"}')
+                if not queue:
+                    try:
+                        await asyncio.wait_for(queue.wait(), timeout=30.0)
+                    except asyncio.TimeoutError:
+                        await websocket.send_bytes(_KEEPALIVE_FRAME)
+                        continue
+
+                # Merge whatever queued up while we were sending into one frame,
+                # bounded so a backlogged client can't hog the loop.
+                batch = queue.drain(max_batch)
+                if len(batch) == 1:
+                    await websocket.send_bytes(batch[0])
+                else:
+                    await websocket.send_bytes(_wrap_batch(batch))
+                if queue:
+                    await asyncio.sleep(0)  # let other clients and the listener run
         except WebSocketDisconnect:
             pass
         except Exception as e:
@@ -153,11 +181,14 @@ app = create_app()
 if __name__ == "__main__":
     import uvicorn
 
-    settings = Settings()
+    settings = get_settings()
     uvicorn.run(
         "app.main:app",
         host=settings.host,
         port=settings.port,
         reload=False,
         log_level=settings.log_level.lower(),
+        loop="auto",  # uvloop where installed (not on Windows), asyncio otherwise
+        http="httptools",
+        ws="websockets",
     )
\ No newline at end of file
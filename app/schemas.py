@@ -1,28 +1,46 @@
-from datetime import datetime, timezone
-from pydantic import BaseModel, Field
+import time
+from functools import cached_property
+from typing import Annotated
 
+import msgspec
 
-class TickerUpdate(BaseModel):
-    """Normalized ticker update we broadcast to clients."""
-    symbol: str = Field(..., examples=["BTCUSDT"])
-    last_price: str = Field(..., description="Last traded price as string", examples=["64000.12"])
-    change_percent: str = Field(..., description="24h price change percentage as string", examples=["1.25"])
-    timestamp: int = Field(..., description="Event time in epoch ms", examples=[1699977777444])
 
-    @property
+class TickerMsg(msgspec.Struct):
+    """
+    Binance 24hr ticker frame, reduced to the fields we use.
+    Other keys in the frame are ignored by the decoder.
+    """
+    s: str  # symbol
+    c: str  # last price
+    P: str  # 24h price change percent
+    E: int  # event time (epoch ms)
+
+
+class CombinedTickerMsg(msgspec.Struct):
+    """Combined-stream envelope: {"stream": "...", "data": {...ticker...}}."""
+    data: TickerMsg
+
+
+class TickerUpdate(msgspec.Struct, frozen=True, dict=True):
+    """
+    Normalized ticker update we broadcast to clients.
+    dict=True gives instances a __dict__ so iso_time can be a cached_property.
+    """
+    symbol: Annotated[str, msgspec.Meta(examples=["BTCUSDT"])]
+    last_price: Annotated[str, msgspec.Meta(description="Last traded price as string", examples=["64000.12"])]
+    change_percent: Annotated[str, msgspec.Meta(description="24h price change percentage as string", examples=["1.25"])]
+    timestamp: Annotated[int, msgspec.Meta(description="Event time in epoch ms", examples=[1699977777444])]
+
+    @cached_property
     def iso_time(self) -> str:
-        return datetime.fromtimestamp(self.timestamp / 1000, tz=timezone.utc).isoformat()
+        """Event time as UTC ISO-8601 with millisecond precision, e.g. 2023-11-14T16:02:57.444Z."""
+        secs, ms = divmod(self.timestamp, 1000)
+        return time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(secs)) + f".{ms:03d}Z"
 
     @classmethod
-    def from_binance(cls, d: dict) -> "TickerUpdate":
+    def from_binance(cls, msg: TickerMsg) -> "TickerUpdate":
         """
-        Accepts message object from either single stream or combined stream:
-          - keys we rely on: s (symbol), c (last price), P (24h %), E (event time)
+        Accepts a decoded Binance ticker frame (single stream, or the `data` of a
+        combined stream). msgspec has already type-checked the fields.
         """
-        s = d.get("s")
-        c = d.get("c")
-        P = d.get("P")
-        E = d.get("E")
-        if s is None or c is None or P is None or E is None:
-            raise ValueError(f"Missing required fields in Binance ticker message; keys={list(d.keys())}")
-        return cls(symbol=str(s), last_price=str(c), change_percent=str(P), timestamp=int(E))
\ No newline at end of file
+        return cls(symbol=msg.s, last_price=msg.c, change_percent=msg.P, timestamp=msg.E)
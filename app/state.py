@@ -1,60 +1,96 @@
 import asyncio
-import json
 import logging
-from typing import Dict
+from collections import deque
+from typing import Deque, Dict
+
+import msgspec
 
 from .schemas import TickerUpdate
 
+_encoder = msgspec.json.Encoder()
+
+# Envelopes around pre-encoded TickerUpdate bytes.
+_TICKER_PREFIX = b'{"type":"ticker","data":'
+_SNAPSHOT_PREFIX = b'{"type":"snapshot","data":['
+_LATEST_PREFIX = b'{"data":['
+
+
+class ClientQueue:
+    """
+    Single-consumer mailbox for one WS client: a bounded deque plus an Event.
+    Appending to a full mailbox drops the oldest frame, and no Future is
+    allocated while frames keep arriving faster than they are sent.
+    """
+    __slots__ = ("_frames", "_ready")
+
+    def __init__(self, maxsize: int) -> None:
+        self._frames: Deque[bytes] = deque(maxlen=maxsize if maxsize > 0 else None)
+        self._ready = asyncio.Event()
+
+    def __len__(self) -> int:
+        return len(self._frames)
+
+    def put_nowait(self, frame: bytes) -> None:
+        self._frames.append(frame)
+        self._ready.set()
+
+    async def wait(self) -> None:
+        """Block until at least one frame is queued."""
+        while not self._frames:
+            self._ready.clear()
+            await self._ready.wait()
+
+    def drain(self, limit: int | None = None) -> list[bytes]:
+        """Remove and return up to `limit` queued frames (all if None), oldest first."""
+        frames = self._frames
+        if limit is None or len(frames) <= limit:
+            out = list(frames)
+            frames.clear()
+            return out
+        popleft = frames.popleft
+        return [popleft() for _ in range(limit)]
+
 
 class Broker:
     """
     In-memory broker:
-      - Stores latest update per symbol
+      - Stores the latest update per symbol as JSON-encoded bytes
       - Maintains a per-client queue to decouple slow consumers
       - Broadcasts new updates to all clients
     """
     def __init__(self, client_queue_size: int = 100):
-        self._latest: Dict[str, TickerUpdate] = {}
-        self._clients: Dict[int, asyncio.Queue[str]] = {}
+        self._latest_serialized: Dict[str, bytes] = {}
+        self._latest_response_bytes: bytes | None = None  # {"data":[...]} body, rebuilt lazily
+        self._clients: Dict[int, ClientQueue] = {}
+        # Copy-on-write view of _clients.values(), rebuilt on (un)register so
+        # publish can iterate it without copying or locking.
+        self._clients_snapshot: tuple[ClientQueue, ...] = ()
         self._client_seq = 0
         self._lock = asyncio.Lock()
         self._client_queue_size = client_queue_size
 
     async def publish(self, update: TickerUpdate) -> None:
-        async with self._lock:
-            self._latest[update.symbol] = update
-            message = json.dumps({"type": "ticker", "data": update.model_dump()})
-            queues = list(self._clients.values())
-
-        for q in queues:
-            try:
-                q.put_nowait(message)
-            except asyncio.QueueFull:
-                try:
-                    _ = q.get_nowait()
-                except asyncio.QueueEmpty:
-                    pass
-                try:
-                    q.put_nowait(message)
-                except asyncio.QueueFull:
-                    logging.debug("Client queue still full; dropping message.")
-
-    async def register(self) -> tuple[int, asyncio.Queue[str]]:
-        q: asyncio.Queue[str] = asyncio.Queue(maxsize=self._client_queue_size)
+        # No lock: nothing below awaits, so the cache updates and the fan-out
+        # happen in one step of the event loop.
+        data = _encoder.encode(update)
+        message = _TICKER_PREFIX + data + b"}"
+        self._latest_serialized[update.symbol] = data
+        self._latest_response_bytes = None
+
+        for q in self._clients_snapshot:
+            q.put_nowait(message)
+
+    async def register(self) -> tuple[int, ClientQueue]:
+        q = ClientQueue(self._client_queue_size)
         async with self._lock:
             self._client_seq += 1
             client_id = self._client_seq
             self._clients[client_id] = q
+            self._clients_snapshot = tuple(self._clients.values())
 
-            if self._latest:
-                snapshot = json.dumps({
-                    "type": "snapshot",
-                    "data": [u.model_dump() for u in self._latest.values()],
-                })
-                try:
-                    q.put_nowait(snapshot)
-                except asyncio.QueueFull:
-                    pass
+            if self._latest_serialized:
+                snapshot = _SNAPSHOT_PREFIX + b",".join(self._latest_serialized.values()) + b"]}"
+                q.put_nowait(snapshot)
 
             logging.info("Client %s connected. total_clients=%d", client_id, len(self._clients))
             return client_id, q
@@ -62,12 +98,20 @@ class Broker:
     async def unregister(self, client_id: int) -> None:
         async with self._lock:
             self._clients.pop(client_id, None)
+            self._clients_snapshot = tuple(self._clients.values())
             logging.info("Client %s disconnected. total_clients=%d", client_id, len(self._clients))
 
-    async def latest(self):
-        async with self._lock:
-            return [u.model_dump() for u in self._latest.values()]
+    async def latest_for(self, symbol: str) -> bytes | None:
+        """Encoded latest update for one symbol, or None if we have not seen it."""
+        return self._latest_serialized.get(symbol)
+
+    async def latest_bytes(self) -> bytes:
+        """JSON body {"data": [...]} for all symbols, cached until the next publish."""
+        body = self._latest_response_bytes
+        if body is None:
+            body = _LATEST_PREFIX + b",".join(self._latest_serialized.values()) + b"]}"
+            self._latest_response_bytes = body
+        return body
         
     async def client_count(self) -> int:
-        async with self._lock:
-            return len(self._clients)
\ No newline at end of file
+        return len(self._clients_snapshot)
\ No newline at end of file
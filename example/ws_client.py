@@ -5,7 +5,7 @@ async def main():
     uri = "ws://localhost:8000/ws"
     async with websockets.connect(uri) as ws:
         async for msg in ws:
-            print(msg)
+            print(msg.decode() if isinstance(msg, bytes) else msg)
 
 if __name__ == "__main__":
     asyncio.run(main())
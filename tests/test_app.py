@@ -146,6 +146,80 @@ def test_health_or_root_exists(client):
     assert resp.status_code == 200, _dump_response(resp)
 
 
+def test_price_unknown_symbol_404(client):
+    """
+    `/price?symbol=` answers from the broker's per-symbol cache; symbols never published are 404.
+    """
+    resp = client.get("/price", params={"symbol": "nosuchpair"})
+    assert resp.status_code == 404, _dump_response(resp)
+    assert "NOSUCHPAIR" in resp.json().get("detail", ""), _dump_response(resp)
+
+
+def test_latest_reflects_publish():
+    """
+    `/latest` and `/price?symbol=` are served from cached bytes; a publish must invalidate them.
+    Uses its own app so the published symbol doesn't leak into the session-scoped broker.
+    """
+    if _create_app is None:
+        pytest.skip("create_app() not available; cannot build an isolated app.")
+    from app.schemas import TickerUpdate  # type: ignore
+
+    isolated = _create_app()
+    with TestClient(isolated) as c:
+        broker = isolated.state.broker
+        c.get("/latest")  # prime the cache
+        update = TickerUpdate(symbol="LTCUSDT", last_price="70.01", change_percent="-0.5", timestamp=1699977777555)
+        c.portal.call(broker.publish, update)
+
+        items = _extract_listish(c.get("/latest").json())
+        assert {"symbol": "LTCUSDT", "last_price": "70.01", "change_percent": "-0.5", "timestamp": 1699977777555} in items
+
+        resp = c.get("/price", params={"symbol": "ltcusdt"})
+        assert resp.status_code == 200, _dump_response(resp)
+        assert resp.json()["last_price"] == "70.01"
+
+
+def test_price_rate_limiter_window(monkeypatch):
+    """
+    The /price limiter admits `capacity` hits per key per window, keys are counted independently,
+    and the count resets when the clock moves into the next window.
+    """
+    import app.main as main_mod  # type: ignore
+    import anyio
+    from types import SimpleNamespace
+
+    # Replace only app.main's `time` so the event loop's own clock is untouched.
+    now = [600.0]  # start of a 60s window
+    monkeypatch.setattr(main_mod, "time", SimpleNamespace(monotonic=lambda: now[0]))
+    limiter = main_mod.InMemoryRateLimiter(capacity=2, period_seconds=60.0)
+
+    async def _hits(*keys):
+        return [await limiter.hit(k) for k in keys]
+
+    assert anyio.run(_hits, "price:a", "price:a", "price:a", "price:b") == [True, True, False, True]
+
+    now[0] += 60.0
+    assert anyio.run(_hits, "price:a") == [True]
+
+
+def test_client_queue_drop_oldest_and_drain_limit():
+    """
+    ClientQueue drops the oldest frame when full, and drain(limit) returns the oldest `limit`
+    frames while leaving the rest queued (the /ws batch cap relies on this).
+    """
+    from app.state import ClientQueue  # type: ignore
+
+    q = ClientQueue(3)
+    for i in range(5):
+        q.put_nowait(b"%d" % i)
+    assert len(q) == 3
+
+    assert q.drain(2) == [b"2", b"3"]
+    assert len(q) == 1
+    assert q.drain() == [b"4"]
+    assert not q
+
+
 def test_websocket_broadcast_roundtrip(client, app):
     """
     End-to-end sanity check for the WebSocket endpoint:
@@ -174,12 +248,9 @@ def test_websocket_broadcast_roundtrip(client, app):
             if hasattr(broker, "publish"):
                 try:
                     from app.schemas import TickerUpdate  # type: ignore
-                    import anyio
-
-                    async def _async_publish():
-                        await broker.publish(TickerUpdate(**fake_update))  # type: ignore
 
-                    anyio.run(_async_publish)
+                    # Publish on the app's event loop so the client's mailbox wakes up.
+                    client.portal.call(broker.publish, TickerUpdate(**fake_update))  # type: ignore
                     published = True
                 except Exception as pub_err:
                     print(f"Publish via broker failed: {pub_err}")
@@ -187,11 +258,28 @@ def test_websocket_broadcast_roundtrip(client, app):
             if not published:
                 pytest.skip("Could not publish via broker; skipping WS roundtrip.")
 
-            recv = ws.receive_text()
-            payload = json.loads(recv)
-            assert payload.get("type") == "ticker", f"Unexpected WS 'type': {payload}"
-            data = payload.get("data", {})
+            # A snapshot and live Binance ticks may arrive around the synthetic update, possibly
+            # merged into batch frames; pick out the frame carrying our timestamp.
+            seen = []
+            ticker = None
+            for _ in range(10):
+                payload = json.loads(ws.receive_bytes())
+                frames = payload["data"] if payload.get("type") == "batch" else [payload]
+                seen.extend(frames)
+                ticker = next(
+                    (f for f in frames
+                     if f.get("type") == "ticker" and f.get("data", {}).get("timestamp") == fake_update["timestamp"]),
+                    None,
+                )
+                if ticker is not None:
+                    break
+            assert ticker is not None, f"Synthetic ticker frame not received; got: {seen}"
+            data = ticker["data"]
             for key in ("symbol", "last_price", "timestamp"):
-                assert key in data, f"Missing '{key}' in WS payload: {payload}"
+                assert key in data, f"Missing '{key}' in WS payload: {ticker}"
+            assert data["symbol"] == fake_update["symbol"], f"Unexpected ticker: {ticker}"
+            assert data["last_price"] == fake_update["last_price"], f"Unexpected ticker: {ticker}"
+    except AssertionError:
+        raise
     except Exception as e:
         pytest.skip(f"WebSocket test skipped due to connection/publish issue: {e}")